@@ -8,14 +8,14 @@ This application provides:
 - Frontend file serving
 """
 
-from flask import Flask, send_file, send_from_directory
+from flask import Flask, g, request, send_file, send_from_directory
 from flask_cors import CORS
 import os
 
 # Import configuration
 from config import (
     DEBUG, PORT, HOST,
-    UPLOAD_FOLDER, PROJECTS_FOLDER, CLIENTS_FOLDER
+    UPLOAD_FOLDER, PROJECTS_FOLDER, CLIENTS_FOLDER, REAPER_ENABLED
 )
 
 # Import route blueprints
@@ -23,6 +23,11 @@ from routes.projects import projects_bp
 from routes.clients import clients_bp
 from routes.contacts import contacts_bp
 from routes.newsletter import newsletter_bp
+from routes.events import events_bp
+from routes.profiles import profiles_bp
+from reaper import start_reaper
+from events import start_change_notifications
+from profiling import should_profile, start_profile, finish_profile
 
 # Initialize Flask application
 app = Flask(__name__, static_folder='../frontend', static_url_path='')
@@ -37,6 +42,52 @@ app.register_blueprint(projects_bp)
 app.register_blueprint(clients_bp)
 app.register_blueprint(contacts_bp)
 app.register_blueprint(newsletter_bp)
+app.register_blueprint(events_bp)
+app.register_blueprint(profiles_bp)
+
+# Start background garbage collection of soft-deleted documents and orphaned images
+if REAPER_ENABLED:
+    start_reaper()
+
+# Follow database changes to invalidate caches and notify connected browsers
+start_change_notifications()
+
+
+# ============================================================================
+# Request Profiling
+# ============================================================================
+
+@app.before_request
+def begin_profiling():
+    """
+    Start sampling the request's call stack if it is selected for profiling.
+    Requests are selected by PROFILE_SAMPLE_RATE or by the profiling secret.
+    """
+    if should_profile(request.headers):
+        g.profile = start_profile()
+
+
+@app.after_request
+def record_profile_status(response):
+    """
+    Remember the response status for the profile summary.
+    """
+    if 'profile' in g:
+        g.profile_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def end_profiling(exc):
+    """
+    Stop sampling and write the capture to disk.
+    """
+    profile = g.pop('profile', None)
+    if profile:
+        try:
+            finish_profile(profile, request.method, request.path, g.get('profile_status'))
+        except OSError as e:
+            print(f'Warning: Could not write profile: {e}')
 
 
 # ============================================================================
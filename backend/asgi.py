@@ -0,0 +1,62 @@
+"""
+ASGI application entry point for the async serving mode.
+
+I/O-bound API endpoints (list GETs, contact and newsletter submissions, the
+change event stream) are served by async Quart views using the Motor driver,
+so a single worker can hold thousands of concurrent connections. Every other route (image uploads,
+deletes, image and frontend file serving) is delegated to the regular Flask
+app on a thread pool of ASGI_WSGI_WORKERS threads; those routes keep the
+thread-per-request concurrency of the sync mode and gain nothing here.
+
+Run with an ASGI server, e.g.:
+    hypercorn asgi:app --bind 0.0.0.0:5000
+"""
+
+from quart import Quart
+from quart_cors import cors
+from a2wsgi import WSGIMiddleware
+from werkzeug.exceptions import HTTPException
+from config import ASGI_WSGI_WORKERS
+
+from app import app as flask_app
+from routes.async_routes import async_bp
+
+# Initialize Quart application for the async routes
+async_app = cors(Quart(__name__))
+async_app.register_blueprint(async_bp)
+
+# Wrap the Flask application so it can serve the remaining routes.
+# Requests run concurrently on a thread pool rather than one at a time.
+sync_app = WSGIMiddleware(flask_app, workers=ASGI_WSGI_WORKERS)
+
+# Bound URL map used to decide which application handles a request
+_async_routes = async_app.url_map.bind('')
+
+
+def _is_async_route(path, method):
+    """
+    Check whether a request is handled by the async routes.
+
+    Args:
+        path (str): Request path
+        method (str): HTTP method
+
+    Returns:
+        bool: True if an async view matches the path and method
+    """
+    try:
+        _async_routes.match(path, method=method)
+        return True
+    except HTTPException:
+        return False
+
+
+async def app(scope, receive, send):
+    """
+    ASGI entry point dispatching between the async and sync applications.
+    """
+    if scope['type'] == 'http' and not _is_async_route(scope['path'], scope['method']):
+        await sync_app(scope, receive, send)
+    else:
+        # Async routes and lifespan events are handled by Quart
+        await async_app(scope, receive, send)
@@ -0,0 +1,123 @@
+"""
+Concurrency benchmark for the sync (WSGI) and async (ASGI) serving modes.
+
+Opens N simultaneous keep-alive connections against a running server and
+replays a request for a fixed duration, then reports throughput, latency
+percentiles and errors. Uses only the standard library.
+
+Example:
+    # Sync mode
+    gunicorn -w 4 --threads 8 -b 0.0.0.0:5000 app:app
+    # Async mode
+    hypercorn -w 4 -b 0.0.0.0:5000 asgi:app
+
+    python benchmark.py --connections 1000 --duration 30 --path /api/projects
+    python benchmark.py --connections 1000 --method POST --path /api/newsletter \\
+        --body '{"email": "bench@example.com"}'
+"""
+
+import argparse
+import asyncio
+import time
+
+
+async def _read_response(reader):
+    """
+    Read one HTTP/1.1 response and return its status code.
+    Only Content-Length bodies are supported, which covers every API route.
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('Connection closed by server')
+    status = int(status_line.split()[1])
+
+    content_length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            content_length = int(value.strip())
+
+    await reader.readexactly(content_length)
+    return status
+
+
+async def _worker(args, request_bytes, deadline, latencies, errors):
+    """
+    Send requests over one keep-alive connection until the deadline passes.
+    """
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(args.host, args.port)
+            start = time.perf_counter()
+            writer.write(request_bytes)
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status >= 500:
+                errors['5xx'] = errors.get('5xx', 0) + 1
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            if writer is not None:
+                writer.close()
+            reader = writer = None
+            await asyncio.sleep(0.05)
+    if writer is not None:
+        writer.close()
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def run_benchmark(args):
+    """
+    Run the benchmark and print a summary.
+    """
+    body = args.body.encode() if args.body else b''
+    headers = [
+        f'{args.method} {args.path} HTTP/1.1',
+        f'Host: {args.host}:{args.port}',
+        'Connection: keep-alive',
+        f'Content-Length: {len(body)}'
+    ]
+    if body:
+        headers.append('Content-Type: application/json')
+    request_bytes = ('\r\n'.join(headers) + '\r\n\r\n').encode() + body
+
+    latencies = []
+    errors = {}
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(args, request_bytes, deadline, latencies, errors)
+        for _ in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f'{args.method} {args.path} with {args.connections} connections for {elapsed:.1f}s')
+    print(f'  Requests:   {len(latencies)} ({len(latencies) / elapsed:.1f} req/s)')
+    print(f'  Latency:    p50 {_percentile(latencies, 0.50) * 1000:.1f} ms, '
+          f'p95 {_percentile(latencies, 0.95) * 1000:.1f} ms, '
+          f'p99 {_percentile(latencies, 0.99) * 1000:.1f} ms')
+    print(f'  Errors:     {errors or "none"}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Concurrency benchmark for the API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--path', default='/api/projects')
+    parser.add_argument('--method', default='GET')
+    parser.add_argument('--body', default='', help='JSON request body')
+    parser.add_argument('--connections', type=int, default=1000)
+    parser.add_argument('--duration', type=float, default=30.0, help='Duration in seconds')
+    asyncio.run(run_benchmark(parser.parse_args()))
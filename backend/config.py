@@ -14,6 +14,10 @@ HOST = '0.0.0.0'
 MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/')
 DATABASE_NAME = 'fullstack_db'
 
+# Async Serving Configuration
+# Threads running the Flask routes that have no async version (asgi.py)
+ASGI_WSGI_WORKERS = int(os.getenv('ASGI_WSGI_WORKERS', '32'))
+
 # Upload Configuration
 # Use absolute path for Render deployment
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +25,53 @@ UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
 PROJECTS_FOLDER = os.path.join(UPLOAD_FOLDER, 'projects')
 CLIENTS_FOLDER = os.path.join(UPLOAD_FOLDER, 'clients')
 
+# Storage Configuration
+# 'local' keeps images on this instance's disk, 's3' uses an S3-compatible bucket
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'local')
+S3_BUCKET = os.getenv('S3_BUCKET', '')
+S3_ENDPOINT_URL = os.getenv('S3_ENDPOINT_URL', '')  # e.g. http://localhost:9000 for MinIO
+S3_REGION = os.getenv('S3_REGION', 'us-east-1')
+S3_ACCESS_KEY = os.getenv('S3_ACCESS_KEY')
+S3_SECRET_KEY = os.getenv('S3_SECRET_KEY')
+S3_MAX_POOL_CONNECTIONS = int(os.getenv('S3_MAX_POOL_CONNECTIONS', '20'))
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # Files above 8 MB use multipart uploads
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+STORAGE_CACHE_FOLDER = os.path.join(BASE_DIR, 'cache')
+STORAGE_CACHE_MAX_BYTES = int(os.getenv('STORAGE_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+
+# Garbage Collection Configuration
+# Soft-deleted documents and unreferenced image files are removed by a background reaper
+REAPER_ENABLED = os.getenv('REAPER_ENABLED', 'true').lower() == 'true'
+REAPER_INTERVAL_SECONDS = int(os.getenv('REAPER_INTERVAL_SECONDS', '300'))
+REAPER_BATCH_SIZE = 100
+ORPHAN_GRACE_SECONDS = 3600  # Leave young files alone so in-flight uploads are never reaped
+
+# Change Notification Configuration
+# MongoDB change streams need a replica set; otherwise events only reach the local process
+CHANGE_STREAMS_ENABLED = os.getenv('CHANGE_STREAMS_ENABLED', 'true').lower() == 'true'
+CACHE_TTL_SECONDS = 30  # Upper bound on staleness when change streams are unavailable
+SSE_HEARTBEAT_SECONDS = 15
+SSE_QUEUE_SIZE = 100
+# Sync mode holds one thread per open event stream; cap them so streams never
+# starve the API. Extra clients get a 503 and retry later (ASGI mode has no cap).
+SSE_MAX_SYNC_STREAMS = int(os.getenv('SSE_MAX_SYNC_STREAMS', '4'))
+
+# Profiling Configuration
+# Off by default: set a sample rate and/or a secret to capture request profiles
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))  # Fraction of requests, 0.0 - 1.0
+PROFILE_SECRET = os.getenv('PROFILE_SECRET', '')  # Requests sending it in X-Profile-Token are always profiled
+PROFILE_SAMPLE_INTERVAL = 0.005  # Seconds between stack samples
+PROFILE_FOLDER = os.path.join(BASE_DIR, 'profiles')
+PROFILE_MAX_CAPTURES = 200
+
+# Idempotency Configuration
+# Duplicate contact submissions within the window return the original response
+IDEMPOTENCY_BACKEND = os.getenv('IDEMPOTENCY_BACKEND', 'mongo')  # 'mongo' (shared) or 'memory' (per process)
+IDEMPOTENCY_WINDOW_SECONDS = int(os.getenv('IDEMPOTENCY_WINDOW_SECONDS', '600'))
+IDEMPOTENCY_CACHE_SIZE = 10000  # Maximum entries kept by the memory backend
+IDEMPOTENCY_LEASE_SECONDS = 30  # Unfinished requests older than this no longer block retries
+IDEMPOTENCY_WAIT_SECONDS = 5  # How long a duplicate waits for the original response
+
 # Image Processing Configuration
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 TARGET_IMAGE_SIZE = (450, 350)  # Width x Height in pixels
@@ -15,6 +15,7 @@ projects_collection = db['projects']
 clients_collection = db['clients']
 contact_collection = db['contacts']
 newsletter_collection = db['newsletter']
+idempotency_collection = db['idempotency_keys']
 
 
 def get_database():
@@ -38,6 +39,32 @@ def get_collections():
         'projects': projects_collection,
         'clients': clients_collection,
         'contacts': contact_collection,
-        'newsletter': newsletter_collection
+        'newsletter': newsletter_collection,
+        'idempotency': idempotency_collection
     }
 
+
+
+# Async MongoDB connection (used by the ASGI serving mode)
+_async_client = None
+
+
+def get_async_collections():
+    """
+    Get collection references backed by the async Motor driver.
+    The Motor client is created on first use so sync mode never imports it.
+    
+    Returns:
+        dict: Dictionary containing all async collection references
+    """
+    global _async_client
+    if _async_client is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        _async_client = AsyncIOMotorClient(MONGODB_URI)
+    async_db = _async_client[DATABASE_NAME]
+    return {
+        'projects': async_db['projects'],
+        'clients': async_db['clients'],
+        'contacts': async_db['contacts'],
+        'newsletter': async_db['newsletter']
+    }
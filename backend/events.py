@@ -0,0 +1,278 @@
+"""
+Change notification subsystem.
+Delivers project and client changes to caches and connected browsers. Uses
+MongoDB change streams when the deployment supports them, so every worker
+process sees every change, and falls back to an in-process event bus fed by
+the write handlers otherwise.
+"""
+
+import asyncio
+import json
+import queue
+import threading
+import time
+from pymongo.errors import OperationFailure, PyMongoError
+from database import db
+from config import CHANGE_STREAMS_ENABLED, CACHE_TTL_SECONDS, SSE_QUEUE_SIZE
+
+# Collections whose changes are broadcast
+WATCHED_COLLECTIONS = ('projects', 'clients')
+
+# MongoDB error codes handled by the change stream watcher
+_CHANGE_STREAMS_UNSUPPORTED = 40573
+_CHANGE_STREAM_HISTORY_LOST = 286
+
+
+class AsyncSubscriber:
+    """
+    Bus subscriber delivering events to an asyncio queue.
+    Events are handed to the subscriber's event loop, so publishing from
+    worker threads is safe.
+    """
+
+    def __init__(self, queue_size=SSE_QUEUE_SIZE):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=queue_size)
+
+    def put_nowait(self, event):
+        try:
+            self.loop.call_soon_threadsafe(self._deliver, event)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    def _deliver(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass
+
+
+class EventBus:
+    """
+    Thread-safe publish/subscribe bus for change events.
+    Each subscriber gets its own bounded queue; events for a subscriber that
+    is not keeping up are dropped instead of blocking the publisher.
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, queue_size=SSE_QUEUE_SIZE):
+        """
+        Register a new subscriber.
+
+        Returns:
+            Queue: Queue receiving every published event
+        """
+        subscriber = queue.Queue(maxsize=queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def subscribe_async(self, queue_size=SSE_QUEUE_SIZE):
+        """
+        Register a new subscriber for the running asyncio event loop.
+
+        Returns:
+            AsyncSubscriber: Subscriber whose queue receives every published event
+        """
+        subscriber = AsyncSubscriber(queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """
+        Remove a subscriber registered with subscribe() or subscribe_async().
+        """
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event):
+        """
+        Send an event to every subscriber.
+
+        Args:
+            event (dict): Event with 'collection', 'operation' and 'id' keys
+        """
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                pass
+
+
+class ListCache:
+    """
+    Cache of list endpoint results, invalidated by change events.
+    Entries also expire after a TTL, which bounds staleness in worker
+    processes that cannot see other processes' events.
+    """
+
+    def __init__(self, ttl=CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._entries = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, name, loader):
+        """
+        Return the cached value for name, loading it on a miss.
+        A value loaded while an invalidation happened is returned but not cached.
+
+        Args:
+            name (str): Cache key, e.g. a collection name
+            loader (callable): Function returning a fresh value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            version = self._versions.get(name, 0)
+
+        value = loader()
+
+        with self._lock:
+            if self._versions.get(name, 0) == version:
+                self._entries[name] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self, name=None):
+        """
+        Drop a cached value, or every cached value when name is None.
+        """
+        with self._lock:
+            names = [name] if name else list(set(self._entries) | set(self._versions))
+            for key in names:
+                self._entries.pop(key, None)
+                self._versions[key] = self._versions.get(key, 0) + 1
+
+
+event_bus = EventBus()
+list_cache = ListCache()
+
+# Set while a change stream is delivering events to this process
+_change_streams_active = threading.Event()
+
+
+def _dispatch(event):
+    list_cache.invalidate(event['collection'])
+    event_bus.publish(event)
+
+
+def notify_change(collection, operation, document_id):
+    """
+    Report a change made by a write handler.
+    The local cache is always invalidated right away, so a read following
+    the write in this process never sees the old list. When change streams
+    are active the same change arrives through the stream, so publishing it
+    is left to the stream to avoid duplicate events.
+
+    Args:
+        collection (str): Name of the changed collection
+        operation (str): 'insert', 'update' or 'delete'
+        document_id: ID of the changed document
+    """
+    list_cache.invalidate(collection)
+    if not _change_streams_active.is_set():
+        _dispatch({'collection': collection, 'operation': operation, 'id': str(document_id)})
+
+
+# SSE messages sent when a stream opens and while it is idle
+SSE_RETRY = 'retry: 5000\n\n'
+SSE_HEARTBEAT = ': heartbeat\n\n'
+
+
+def format_sse(event):
+    """
+    Format a change event as a Server-Sent Events message.
+
+    Args:
+        event (dict): Change event
+
+    Returns:
+        str: SSE message of type 'change' with a JSON payload
+    """
+    return f'event: change\ndata: {json.dumps(event)}\n\n'
+
+
+def _event_from_change(change):
+    """
+    Convert a change stream document into a change event.
+    Soft deletes are reported as deletes.
+    """
+    operation = change['operationType']
+    if operation == 'update':
+        updated_fields = change.get('updateDescription', {}).get('updatedFields', {})
+        if 'deletedAt' in updated_fields:
+            operation = 'delete'
+    elif operation == 'replace':
+        operation = 'update'
+    return {
+        'collection': change['ns']['coll'],
+        'operation': operation,
+        'id': str(change['documentKey']['_id'])
+    }
+
+
+def _watch_changes():
+    """
+    Follow the database change stream, reconnecting on errors.
+    Returns when the deployment does not support change streams.
+    """
+    # Skip the reaper's own writes: permanent deletes of tombstones that were
+    # already reported by their soft delete, and its reapRetryAt bookkeeping
+    pipeline = [{'$match': {
+        'ns.coll': {'$in': list(WATCHED_COLLECTIONS)},
+        '$or': [
+            {'operationType': {'$in': ['insert', 'replace']}},
+            {'operationType': 'update',
+             'updateDescription.updatedFields.reapRetryAt': {'$exists': False}}
+        ]
+    }}]
+    resume_token = None
+
+    while True:
+        try:
+            with db.watch(pipeline, resume_after=resume_token) as stream:
+                _change_streams_active.set()
+                for change in stream:
+                    resume_token = stream.resume_token
+                    _dispatch(_event_from_change(change))
+        except OperationFailure as e:
+            _change_streams_active.clear()
+            if e.code == _CHANGE_STREAMS_UNSUPPORTED:
+                print('Change streams unavailable, using in-process change notifications')
+                return
+            if e.code == _CHANGE_STREAM_HISTORY_LOST:
+                # Changes were missed while disconnected; start over with empty caches
+                resume_token = None
+                list_cache.invalidate()
+            else:
+                print(f'Warning: Change stream failed: {e}')
+            time.sleep(5)
+        except PyMongoError as e:
+            _change_streams_active.clear()
+            print(f'Warning: Change stream failed: {e}')
+            time.sleep(5)
+
+
+def start_change_notifications():
+    """
+    Start following MongoDB change streams in a background daemon thread.
+    Until the stream is connected, write handlers notify the local process.
+
+    Returns:
+        Thread | None: The watcher thread, or None if change streams are disabled
+    """
+    if not CHANGE_STREAMS_ENABLED:
+        return None
+    thread = threading.Thread(target=_watch_changes, name='change-stream', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,488 @@
+"""
+Duplicate suppression for form submissions.
+Requests are identified by their Idempotency-Key header and by a hash of
+their content. A repeated request within the window gets the stored
+response of the original request instead of performing another write.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from database import idempotency_collection, get_async_collections
+from config import (
+    IDEMPOTENCY_BACKEND, IDEMPOTENCY_WINDOW_SECONDS, IDEMPOTENCY_CACHE_SIZE,
+    IDEMPOTENCY_LEASE_SECONDS, IDEMPOTENCY_WAIT_SECONDS
+)
+
+# Header clients use to tag retries of the same request
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+
+# Header marking a response replayed from the store
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+# Returned by reserve() while the original request is still being processed
+PENDING = 'pending'
+
+# Returned by reserve() when an Idempotency-Key is reused with different content
+MISMATCH = 'mismatch'
+
+# Seconds between checks while waiting for a pending original request
+_WAIT_INTERVAL = 0.1
+
+# MongoDB error code raised when an index exists with different options
+_INDEX_OPTIONS_CONFLICT = 85
+
+
+def request_keys(scope, idempotency_key, payload):
+    """
+    Build the keys identifying a request.
+
+    Args:
+        scope (str): Name of the endpoint, so keys never clash across endpoints
+        idempotency_key (str): Value of the Idempotency-Key header, or None
+        payload (dict): Normalized request data
+
+    Returns:
+        tuple: (keys to reserve, fingerprint of the request content)
+    """
+    content = json.dumps(payload, sort_keys=True).encode()
+    fingerprint = hashlib.sha256(content).hexdigest()
+    keys = [f'{scope}:content:{fingerprint}']
+    if idempotency_key:
+        keys.insert(0, f'{scope}:key:{hashlib.sha256(idempotency_key.encode()).hexdigest()}')
+    return keys, fingerprint
+
+
+def _duplicate_response(existing):
+    """
+    Build the (body, status, headers) response for a reserve() result.
+    """
+    if existing == PENDING:
+        return {'error': 'A matching request is already being processed'}, 409, {}
+    if existing == MISMATCH:
+        return {'error': f'{IDEMPOTENCY_HEADER} was already used for a different request'}, 422, {}
+    body, status = existing
+    return body, status, {REPLAYED_HEADER: 'true'}
+
+
+def check_duplicate(store, keys, fingerprint, wait=IDEMPOTENCY_WAIT_SECONDS):
+    """
+    Reserve a request, or build the response for a duplicate of an earlier one.
+    A duplicate of a request still in progress (e.g. a double-click) waits
+    for the original to finish and replays its response. If the original
+    fails instead, the duplicate takes over its reservation.
+
+    Args:
+        store: Idempotency store from get_idempotency_store()
+        keys (list): Keys from request_keys()
+        fingerprint (str): Fingerprint from request_keys()
+        wait (float): Seconds to wait for a pending original request
+
+    Returns:
+        tuple | None: None if the request is new and was reserved, otherwise
+        the (body, status, headers) to respond with
+    """
+    deadline = time.monotonic() + wait
+    existing = store.reserve(keys, fingerprint)
+    while existing == PENDING and time.monotonic() < deadline:
+        time.sleep(_WAIT_INTERVAL)
+        existing = store.reserve(keys, fingerprint)
+    return None if existing is None else _duplicate_response(existing)
+
+
+async def check_duplicate_async(store, keys, fingerprint, wait=IDEMPOTENCY_WAIT_SECONDS):
+    """
+    Async version of check_duplicate() for stores from get_async_idempotency_store().
+    """
+    deadline = time.monotonic() + wait
+    existing = await store.reserve(keys, fingerprint)
+    while existing == PENDING and time.monotonic() < deadline:
+        await asyncio.sleep(_WAIT_INTERVAL)
+        existing = await store.reserve(keys, fingerprint)
+    return None if existing is None else _duplicate_response(existing)
+
+
+def record_response(store, keys, body, status):
+    """
+    Store the response of a reserved request for replay.
+    Failures are logged rather than raised: the write already succeeded, and
+    the reservation's lease expires on its own.
+
+    Args:
+        store: Idempotency store from get_idempotency_store()
+        keys (list): Keys from request_keys()
+        body (dict): JSON response body
+        status (int): Response status code
+    """
+    try:
+        store.complete(keys, body, status)
+    except Exception as e:
+        print(f'Warning: Could not store idempotent response: {e}')
+
+
+async def record_response_async(store, keys, body, status):
+    """
+    Async version of record_response() for stores from get_async_idempotency_store().
+    """
+    try:
+        await store.complete(keys, body, status)
+    except Exception as e:
+        print(f'Warning: Could not store idempotent response: {e}')
+
+
+class MemoryIdempotencyStore:
+    """
+    Bounded in-memory LRU store. Only suppresses duplicates that reach the
+    same process.
+    """
+
+    def __init__(self, window=IDEMPOTENCY_WINDOW_SECONDS, max_entries=IDEMPOTENCY_CACHE_SIZE,
+                 lease=IDEMPOTENCY_LEASE_SECONDS):
+        self.window = window
+        self.max_entries = max_entries
+        self.lease = lease
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _reserve_one(self, key, fingerprint):
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry:
+            created, stored_fingerprint, result = entry
+            expired = now - created >= (self.lease if result == PENDING else self.window)
+            if not expired:
+                self._entries.move_to_end(key)
+                return MISMATCH if stored_fingerprint != fingerprint else result
+        self._entries[key] = (now, fingerprint, PENDING)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return None
+
+    def _complete(self, keys, body, status):
+        for key in keys:
+            if key in self._entries:
+                created, fingerprint, _ = self._entries[key]
+                self._entries[key] = (created, fingerprint, (body, status))
+
+    def reserve(self, keys, fingerprint):
+        """
+        Reserve keys for a new request.
+        When the content matches an earlier response, the keys reserved so
+        far (the request's Idempotency-Key) are bound to that response.
+
+        Args:
+            keys (list): Keys from request_keys()
+            fingerprint (str): Fingerprint from request_keys()
+
+        Returns:
+            None if the request is new, PENDING if a matching request is in
+            progress, MISMATCH if the Idempotency-Key was used with other
+            content, or the stored (body, status) of the original response
+        """
+        with self._lock:
+            reserved = []
+            for key in keys:
+                existing = self._reserve_one(key, fingerprint)
+                if existing is None:
+                    reserved.append(key)
+                    continue
+                if isinstance(existing, tuple):
+                    self._complete(reserved, *existing)
+                else:
+                    for reserved_key in reserved:
+                        self._entries.pop(reserved_key, None)
+                return existing
+            return None
+
+    def complete(self, keys, body, status):
+        """
+        Store the response of a request reserved with reserve().
+        """
+        with self._lock:
+            self._complete(keys, body, status)
+
+    def release(self, keys):
+        """
+        Drop the reservation of a request that failed, so it can be retried.
+        """
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class AsyncMemoryIdempotencyStore:
+    """
+    Async interface over MemoryIdempotencyStore. Its operations never block
+    on I/O, so they run directly on the event loop.
+    """
+
+    def __init__(self, store=None):
+        self.store = store or MemoryIdempotencyStore()
+
+    async def reserve(self, keys, fingerprint):
+        return self.store.reserve(keys, fingerprint)
+
+    async def complete(self, keys, body, status):
+        self.store.complete(keys, body, status)
+
+    async def release(self, keys):
+        self.store.release(keys)
+
+
+class _MongoStoreRules:
+    """
+    Record layout and expiry rules shared by the sync and async MongoDB stores.
+    """
+
+    def __init__(self, window, lease):
+        self.window = window
+        self.lease = lease
+
+    def _ttl_index_update(self, collection_name):
+        return {
+            'collMod': collection_name,
+            'index': {'keyPattern': {'createdAt': 1}, 'expireAfterSeconds': self.window}
+        }
+
+    @staticmethod
+    def _new_record(key, fingerprint, now):
+        return {'_id': key, 'createdAt': now, 'fingerprint': fingerprint}
+
+    def _is_expired(self, existing, now):
+        """
+        Check whether a record expired, or is a pending request that never finished.
+        """
+        pending = 'status' not in existing
+        age = now - existing['createdAt'].replace(tzinfo=timezone.utc)
+        return age >= timedelta(seconds=self.lease if pending else self.window)
+
+    @staticmethod
+    def _stored_result(existing, fingerprint):
+        if existing.get('fingerprint') != fingerprint:
+            return MISMATCH
+        if 'status' not in existing:
+            return PENDING
+        return existing['body'], existing['status']
+
+
+class MongoIdempotencyStore(_MongoStoreRules):
+    """
+    Store shared by every process, backed by a MongoDB collection with a TTL
+    index. Reservations rely on the unique _id, so concurrent duplicates
+    cannot both be processed.
+    """
+
+    def __init__(self, collection=idempotency_collection, window=IDEMPOTENCY_WINDOW_SECONDS,
+                 lease=IDEMPOTENCY_LEASE_SECONDS):
+        super().__init__(window, lease)
+        self.collection = collection
+        self._ensure_ttl_index()
+
+    def _ensure_ttl_index(self):
+        """
+        Create the TTL index, updating its expiry if the window has changed.
+        Expiry is also checked on every lookup, so a missing index only
+        delays cleanup and is logged rather than raised.
+        """
+        try:
+            self.collection.create_index('createdAt', expireAfterSeconds=self.window)
+        except OperationFailure as e:
+            if e.code != _INDEX_OPTIONS_CONFLICT:
+                print(f'Warning: Could not create idempotency TTL index: {e}')
+                return
+            try:
+                self.collection.database.command(self._ttl_index_update(self.collection.name))
+            except OperationFailure as e:
+                print(f'Warning: Could not update idempotency TTL index: {e}')
+
+    def _reserve_one(self, key, fingerprint):
+        now = datetime.now(timezone.utc)
+        for _ in range(2):
+            try:
+                self.collection.insert_one(self._new_record(key, fingerprint, now))
+                return None
+            except DuplicateKeyError:
+                existing = self.collection.find_one({'_id': key})
+                if existing is None:
+                    continue  # Expired between the insert and the lookup
+                if self._is_expired(existing, now):
+                    self.collection.delete_one({'_id': key, 'createdAt': existing['createdAt']})
+                    continue
+                return self._stored_result(existing, fingerprint)
+        return PENDING
+
+    def reserve(self, keys, fingerprint):
+        """
+        Reserve keys for a new request.
+        When the content matches an earlier response, the keys reserved so
+        far (the request's Idempotency-Key) are bound to that response.
+
+        Args:
+            keys (list): Keys from request_keys()
+            fingerprint (str): Fingerprint from request_keys()
+
+        Returns:
+            None if the request is new, PENDING if a matching request is in
+            progress, MISMATCH if the Idempotency-Key was used with other
+            content, or the stored (body, status) of the original response
+        """
+        reserved = []
+        for key in keys:
+            existing = self._reserve_one(key, fingerprint)
+            if existing is None:
+                reserved.append(key)
+                continue
+            if isinstance(existing, tuple):
+                if reserved:
+                    self.complete(reserved, *existing)
+            else:
+                self.release(reserved)
+            return existing
+        return None
+
+    def complete(self, keys, body, status):
+        """
+        Store the response of a request reserved with reserve().
+        """
+        self.collection.update_many(
+            {'_id': {'$in': keys}},
+            {'$set': {'body': body, 'status': status}}
+        )
+
+    def release(self, keys):
+        """
+        Drop the reservation of a request that failed, so it can be retried.
+        """
+        if keys:
+            self.collection.delete_many({'_id': {'$in': keys}, 'status': {'$exists': False}})
+
+
+class AsyncMongoIdempotencyStore(_MongoStoreRules):
+    """
+    MongoDB store on the async Motor driver, with the same behaviour and
+    records as MongoIdempotencyStore. The TTL index is set up on first use.
+    """
+
+    def __init__(self, window=IDEMPOTENCY_WINDOW_SECONDS, lease=IDEMPOTENCY_LEASE_SECONDS):
+        super().__init__(window, lease)
+        self.collection = get_async_collections()['idempotency']
+        self._index_ready = False
+
+    async def _ensure_ttl_index(self):
+        """
+        Create or update the TTL index once; see MongoIdempotencyStore.
+        """
+        if self._index_ready:
+            return
+        self._index_ready = True
+        try:
+            await self.collection.create_index('createdAt', expireAfterSeconds=self.window)
+        except OperationFailure as e:
+            if e.code != _INDEX_OPTIONS_CONFLICT:
+                print(f'Warning: Could not create idempotency TTL index: {e}')
+                return
+            try:
+                await self.collection.database.command(self._ttl_index_update(self.collection.name))
+            except OperationFailure as e:
+                print(f'Warning: Could not update idempotency TTL index: {e}')
+
+    async def _reserve_one(self, key, fingerprint):
+        now = datetime.now(timezone.utc)
+        for _ in range(2):
+            try:
+                await self.collection.insert_one(self._new_record(key, fingerprint, now))
+                return None
+            except DuplicateKeyError:
+                existing = await self.collection.find_one({'_id': key})
+                if existing is None:
+                    continue  # Expired between the insert and the lookup
+                if self._is_expired(existing, now):
+                    await self.collection.delete_one({'_id': key, 'createdAt': existing['createdAt']})
+                    continue
+                return self._stored_result(existing, fingerprint)
+        return PENDING
+
+    async def reserve(self, keys, fingerprint):
+        """
+        Reserve keys for a new request; see MongoIdempotencyStore.reserve().
+        """
+        await self._ensure_ttl_index()
+        reserved = []
+        for key in keys:
+            existing = await self._reserve_one(key, fingerprint)
+            if existing is None:
+                reserved.append(key)
+                continue
+            if isinstance(existing, tuple):
+                if reserved:
+                    await self.complete(reserved, *existing)
+            else:
+                await self.release(reserved)
+            return existing
+        return None
+
+    async def complete(self, keys, body, status):
+        """
+        Store the response of a request reserved with reserve().
+        """
+        await self.collection.update_many(
+            {'_id': {'$in': keys}},
+            {'$set': {'body': body, 'status': status}}
+        )
+
+    async def release(self, keys):
+        """
+        Drop the reservation of a request that failed, so it can be retried.
+        """
+        if keys:
+            await self.collection.delete_many({'_id': {'$in': keys}, 'status': {'$exists': False}})
+
+
+_store = None
+_async_store = None
+_store_lock = threading.Lock()
+
+
+def get_idempotency_store():
+    """
+    Get the configured idempotency store, creating it on first use.
+
+    Returns:
+        MemoryIdempotencyStore | MongoIdempotencyStore: Store selected by IDEMPOTENCY_BACKEND
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            if IDEMPOTENCY_BACKEND == 'mongo':
+                _store = MongoIdempotencyStore()
+            elif IDEMPOTENCY_BACKEND == 'memory':
+                _store = MemoryIdempotencyStore()
+            else:
+                raise RuntimeError(f'Unknown idempotency backend: {IDEMPOTENCY_BACKEND}')
+    return _store
+
+
+def get_async_idempotency_store():
+    """
+    Get the configured idempotency store for async routes, creating it on first use.
+    Creating it performs no I/O, so it is safe to call on the event loop.
+
+    Returns:
+        AsyncMemoryIdempotencyStore | AsyncMongoIdempotencyStore: Store selected by IDEMPOTENCY_BACKEND
+    """
+    global _async_store
+    if _async_store is None:
+        if IDEMPOTENCY_BACKEND == 'mongo':
+            _async_store = AsyncMongoIdempotencyStore()
+        elif IDEMPOTENCY_BACKEND == 'memory':
+            # Share entries with the sync routes served by the same process
+            _async_store = AsyncMemoryIdempotencyStore(get_idempotency_store())
+        else:
+            raise RuntimeError(f'Unknown idempotency backend: {IDEMPOTENCY_BACKEND}')
+    return _async_store
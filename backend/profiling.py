@@ -0,0 +1,205 @@
+"""
+Request profiling with sampled stack captures.
+Samples the call stack of a request's thread while it runs and writes the
+result as a collapsed-stack file (one 'frame;frame;frame count' line per
+stack), ready for flamegraph.pl or speedscope, plus a JSON summary.
+"""
+
+import hmac
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from config import (
+    PROFILE_SAMPLE_RATE, PROFILE_SECRET, PROFILE_SAMPLE_INTERVAL,
+    PROFILE_FOLDER, PROFILE_MAX_CAPTURES
+)
+
+# Header carrying the profiling secret
+PROFILE_HEADER = 'X-Profile-Token'
+
+
+class StackSampler:
+    """
+    Periodically sample the call stack of one thread from a helper thread.
+    """
+
+    def __init__(self, thread_id, interval=PROFILE_SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+
+
+def is_authorized(headers):
+    """
+    Check whether request headers carry the profiling secret.
+
+    Args:
+        headers: Request headers
+
+    Returns:
+        bool: True if PROFILE_SECRET is set and matches the header
+    """
+    token = headers.get(PROFILE_HEADER, '')
+    # Compare bytes: compare_digest rejects non-ASCII str input
+    return bool(PROFILE_SECRET) and hmac.compare_digest(token.encode(), PROFILE_SECRET.encode())
+
+
+def should_profile(headers):
+    """
+    Decide whether to profile a request.
+
+    Args:
+        headers: Request headers
+
+    Returns:
+        bool: True if the request carries the secret or is randomly sampled
+    """
+    return is_authorized(headers) or (PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE)
+
+
+def start_profile():
+    """
+    Start sampling the current thread.
+
+    Returns:
+        tuple: (sampler, start time) to pass to finish_profile()
+    """
+    sampler = StackSampler(threading.get_ident())
+    sampler.start()
+    return sampler, time.perf_counter()
+
+
+def _time_share(stacks, total_samples, duration, predicate):
+    matching = sum(count for stack, count in stacks.items() if predicate(stack))
+    return round(duration * matching / total_samples, 2) if total_samples else 0.0
+
+
+def _is_pymongo(stack):
+    return ';pymongo.' in stack or ';bson.' in stack
+
+
+def _is_pillow_crop(stack):
+    return 'utils:crop_image;' in stack and ';PIL.' in stack
+
+
+def finish_profile(profile, method, path, status):
+    """
+    Stop sampling and write the collapsed stacks and summary to disk.
+
+    Args:
+        profile (tuple): Value returned by start_profile()
+        method (str): HTTP method of the request
+        path (str): Request path
+        status (int): Response status code, or None if unknown
+
+    Returns:
+        dict: Summary of the captured request
+    """
+    sampler, started = profile
+    sampler.stop()
+    duration = (time.perf_counter() - started) * 1000
+    total_samples = sum(sampler.stacks.values())
+
+    now = datetime.now(timezone.utc)
+    capture_id = f"{now.strftime('%Y%m%dT%H%M%S%f')}_{os.getpid()}_{threading.get_ident()}"
+    summary = {
+        'id': capture_id,
+        'method': method,
+        'path': path,
+        'status': status,
+        'capturedAt': now.isoformat(),
+        'durationMs': round(duration, 2),
+        'samples': total_samples,
+        'pymongoMs': _time_share(sampler.stacks, total_samples, duration, _is_pymongo),
+        'pillowMs': _time_share(sampler.stacks, total_samples, duration, _is_pillow_crop)
+    }
+
+    os.makedirs(PROFILE_FOLDER, exist_ok=True)
+    with open(os.path.join(PROFILE_FOLDER, f'{capture_id}.collapsed'), 'w') as f:
+        for stack, count in sampler.stacks.most_common():
+            f.write(f'{stack} {count}\n')
+    with open(os.path.join(PROFILE_FOLDER, f'{capture_id}.json'), 'w') as f:
+        json.dump(summary, f)
+
+    _prune_captures()
+    return summary
+
+
+def _prune_captures():
+    """
+    Delete the oldest captures beyond PROFILE_MAX_CAPTURES.
+    """
+    summaries = sorted(name for name in os.listdir(PROFILE_FOLDER) if name.endswith('.json'))
+    for name in summaries[:-PROFILE_MAX_CAPTURES]:
+        capture_id = name[:-len('.json')]
+        for extension in ('.json', '.collapsed'):
+            try:
+                os.remove(os.path.join(PROFILE_FOLDER, capture_id + extension))
+            except OSError:
+                pass
+
+
+def list_captures(limit=20):
+    """
+    List captured requests, slowest first.
+
+    Args:
+        limit (int): Maximum number of captures to return
+
+    Returns:
+        list: Capture summaries
+    """
+    if not os.path.isdir(PROFILE_FOLDER):
+        return []
+
+    summaries = []
+    for name in os.listdir(PROFILE_FOLDER):
+        if not name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(PROFILE_FOLDER, name)) as f:
+                summaries.append(json.load(f))
+        except (OSError, ValueError):
+            continue  # Pruned or still being written by another worker
+
+    summaries.sort(key=lambda summary: summary['durationMs'], reverse=True)
+    return summaries[:limit]
+
+
+def capture_path(capture_id):
+    """
+    Get the collapsed-stack file of a capture.
+
+    Args:
+        capture_id (str): Capture ID from a summary
+
+    Returns:
+        str | None: Path to the file, or None if it does not exist
+    """
+    path = os.path.join(PROFILE_FOLDER, f'{os.path.basename(capture_id)}.collapsed')
+    return path if os.path.exists(path) else None
@@ -0,0 +1,149 @@
+"""
+Background garbage collection for soft-deleted documents and image files.
+Removes tombstoned projects and clients together with their images, and
+deletes stored images that are no longer referenced by any document.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from database import projects_collection, clients_collection
+from config import REAPER_INTERVAL_SECONDS, REAPER_BATCH_SIZE, ORPHAN_GRACE_SECONDS
+from storage import get_storage
+
+# Collections whose documents reference images, keyed by storage category
+IMAGE_COLLECTIONS = {
+    'projects': projects_collection,
+    'clients': clients_collection
+}
+
+
+def reap_tombstones(collection, category, batch_size=REAPER_BATCH_SIZE,
+                    retry_seconds=REAPER_INTERVAL_SECONDS):
+    """
+    Permanently remove soft-deleted documents and their images.
+    A document is only removed once its image has been deleted, so failures
+    are retried instead of leaving orphaned files. Failed documents are set
+    aside until retry_seconds have passed, so they never block a batch.
+    Images still referenced by a live document are kept.
+
+    Args:
+        collection: MongoDB collection to clean up
+        category (str): Storage category of the collection's images
+        batch_size (int): Maximum number of documents removed per batch
+        retry_seconds (int): Delay before a failed document is retried
+
+    Returns:
+        int: Number of documents removed
+    """
+    storage = get_storage()
+    removed = 0
+
+    while True:
+        now = datetime.now(timezone.utc)
+        tombstones = list(
+            collection.find(
+                {'deletedAt': {'$exists': True}, 'reapRetryAt': {'$not': {'$gt': now}}},
+                {'image': 1}
+            ).sort('deletedAt', 1).limit(batch_size)
+        )
+        if not tombstones:
+            break
+
+        reaped_ids = []
+        failed_ids = []
+        for document in tombstones:
+            try:
+                image = document.get('image')
+                if image and not collection.count_documents(
+                        {'image': image, 'deletedAt': {'$exists': False}}, limit=1):
+                    storage.delete(category, image)
+                reaped_ids.append(document['_id'])
+            except Exception as e:
+                print(f'Warning: Could not delete image file: {e}')
+                failed_ids.append(document['_id'])
+
+        if reaped_ids:
+            removed += collection.delete_many({'_id': {'$in': reaped_ids}}).deleted_count
+        if failed_ids:
+            collection.update_many(
+                {'_id': {'$in': failed_ids}},
+                {'$set': {'reapRetryAt': now + timedelta(seconds=retry_seconds)}}
+            )
+        if len(tombstones) < batch_size:
+            break
+
+    return removed
+
+
+def reap_orphans(collection, category, grace_seconds=ORPHAN_GRACE_SECONDS):
+    """
+    Delete stored images that no document references.
+    Files younger than the grace period are skipped, since an upload is
+    stored before its document is inserted.
+
+    Args:
+        collection: MongoDB collection referencing the images
+        category (str): Storage category to scan
+        grace_seconds (int): Minimum file age in seconds before it can be reaped
+
+    Returns:
+        int: Number of files removed
+    """
+    storage = get_storage()
+    cutoff = time.time() - grace_seconds
+    referenced = set(collection.distinct('image'))
+    removed = 0
+
+    for filename, modified in storage.list_files(category):
+        if filename in referenced or modified > cutoff:
+            continue
+        try:
+            storage.delete(category, filename)
+            removed += 1
+        except Exception as e:
+            print(f'Warning: Could not delete orphaned file {filename}: {e}')
+
+    return removed
+
+
+def run_once():
+    """
+    Run a full garbage collection pass over every image collection.
+
+    Returns:
+        dict: Number of documents and files removed per category
+    """
+    results = {}
+    for category, collection in IMAGE_COLLECTIONS.items():
+        results[category] = {
+            'documents': reap_tombstones(collection, category),
+            'files': reap_orphans(collection, category)
+        }
+    return results
+
+
+def _reaper_loop(interval):
+    while True:
+        try:
+            run_once()
+        except Exception as e:
+            # Keep the reaper alive through transient database or storage errors
+            print(f'Warning: Garbage collection failed: {e}')
+        time.sleep(interval)
+
+
+def start_reaper(interval=REAPER_INTERVAL_SECONDS):
+    """
+    Start the garbage collector in a background daemon thread.
+    Running it in several processes at once is safe: every step is idempotent.
+
+    Args:
+        interval (int): Seconds between collection passes
+
+    Returns:
+        Thread: The started reaper thread
+    """
+    thread = threading.Thread(target=_reaper_loop, args=(interval,), name='reaper', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,220 @@
+"""
+Async API routes for the ASGI serving mode.
+Provides async versions of the I/O-bound endpoints (list GETs, contact and
+newsletter submissions, the change event stream) backed by the Motor driver.
+Responses match the sync routes exactly.
+"""
+
+import asyncio
+from quart import Blueprint, Response, request, jsonify
+from database import get_async_collections
+from events import event_bus, format_sse, SSE_RETRY, SSE_HEARTBEAT
+from config import API_BASE_URL, SSE_HEARTBEAT_SECONDS
+from idempotency import check_duplicate_async, record_response_async, get_async_idempotency_store
+from routes.contacts import parse_contact, contact_request_keys, contact_created_body
+
+# Create blueprint for async routes
+async_bp = Blueprint('async_api', __name__)
+
+
+async def _list_documents(name, query=None, sort_newest=False):
+    """
+    Fetch every matching document of a collection with string IDs.
+
+    Args:
+        name (str): Collection name
+        query (dict): Optional filter for the documents
+        sort_newest (bool): Sort by newest first when True
+
+    Returns:
+        list: Documents with '_id' converted to str
+    """
+    cursor = get_async_collections()[name].find(query or {})
+    if sort_newest:
+        cursor = cursor.sort('_id', -1)
+    documents = await cursor.to_list(length=None)
+    for document in documents:
+        document['_id'] = str(document['_id'])
+    return documents
+
+
+@async_bp.route(f'{API_BASE_URL}/projects', methods=['GET'])
+async def get_projects():
+    """
+    Retrieve all projects from the database.
+
+    Returns:
+        JSON: List of all projects with their details
+    """
+    try:
+        return jsonify(await _list_documents('projects', {'deletedAt': {'$exists': False}})), 200
+    except Exception as e:
+        return jsonify({'error': f'Error retrieving projects: {str(e)}'}), 500
+
+
+@async_bp.route(f'{API_BASE_URL}/clients', methods=['GET'])
+async def get_clients():
+    """
+    Retrieve all clients from the database.
+
+    Returns:
+        JSON: List of all clients with their details
+    """
+    try:
+        return jsonify(await _list_documents('clients', {'deletedAt': {'$exists': False}})), 200
+    except Exception as e:
+        return jsonify({'error': f'Error retrieving clients: {str(e)}'}), 500
+
+
+@async_bp.route(f'{API_BASE_URL}/contact', methods=['POST'])
+async def submit_contact():
+    """
+    Submit a contact form.
+    Duplicate submissions return the original response (see routes/contacts.py).
+
+    Expected JSON data:
+        - fullName: Full name of the contact (required)
+        - email: Email address (required)
+        - mobile: Mobile phone number (required)
+        - city: City name (required)
+
+    Returns:
+        JSON: Created contact object with ID
+    """
+    try:
+        contact, error = parse_contact(await request.get_json(silent=True))
+        if error:
+            return jsonify({'error': error}), 400
+
+        # Suppress duplicate submissions
+        store = get_async_idempotency_store()
+        keys, fingerprint = contact_request_keys(contact, request.headers)
+        duplicate = await check_duplicate_async(store, keys, fingerprint)
+        if duplicate:
+            body, status, headers = duplicate
+            return jsonify(body), status, headers
+
+        try:
+            # Save to database
+            result = await get_async_collections()['contacts'].insert_one(contact)
+        except Exception:
+            await store.release(keys)
+            raise
+
+        body = contact_created_body(contact, result.inserted_id)
+        await record_response_async(store, keys, body, 201)
+
+        return jsonify(body), 201
+
+    except Exception as e:
+        return jsonify({'error': f'Error submitting contact form: {str(e)}'}), 500
+
+
+@async_bp.route(f'{API_BASE_URL}/contact', methods=['GET'])
+async def get_contacts():
+    """
+    Retrieve all contact form submissions, newest first.
+
+    Returns:
+        JSON: List of all contact form submissions
+    """
+    try:
+        return jsonify(await _list_documents('contacts', sort_newest=True)), 200
+    except Exception as e:
+        return jsonify({'error': f'Error retrieving contacts: {str(e)}'}), 500
+
+
+@async_bp.route(f'{API_BASE_URL}/newsletter', methods=['POST'])
+async def subscribe_newsletter():
+    """
+    Subscribe an email address to the newsletter.
+    Prevents duplicate subscriptions.
+
+    Expected JSON data:
+        - email: Email address to subscribe (required)
+
+    Returns:
+        JSON: Subscription confirmation or existing subscription message
+    """
+    try:
+        data = await request.get_json(silent=True)
+
+        if not data:
+            return jsonify({'error': 'No data provided'}), 400
+
+        email = data.get('email', '').strip().lower()
+
+        # Validate email
+        if not email:
+            return jsonify({'error': 'Email is required'}), 400
+
+        if '@' not in email:
+            return jsonify({'error': 'Invalid email format'}), 400
+
+        newsletter_collection = get_async_collections()['newsletter']
+
+        # Check if already subscribed
+        existing = await newsletter_collection.find_one({'email': email})
+        if existing:
+            return jsonify({
+                'message': 'Email is already subscribed',
+                'email': email
+            }), 200
+
+        # Create new subscription
+        subscription = {'email': email}
+        result = await newsletter_collection.insert_one(subscription)
+        subscription['_id'] = str(result.inserted_id)
+
+        return jsonify({
+            'message': 'Successfully subscribed to newsletter',
+            'subscription': subscription
+        }), 201
+
+    except Exception as e:
+        return jsonify({'error': f'Error subscribing to newsletter: {str(e)}'}), 500
+
+
+@async_bp.route(f'{API_BASE_URL}/newsletter', methods=['GET'])
+async def get_subscriptions():
+    """
+    Retrieve all newsletter subscriptions, newest first.
+
+    Returns:
+        JSON: List of all newsletter subscriptions
+    """
+    try:
+        return jsonify(await _list_documents('newsletter', sort_newest=True)), 200
+    except Exception as e:
+        return jsonify({'error': f'Error retrieving subscriptions: {str(e)}'}), 500
+
+
+@async_bp.route(f'{API_BASE_URL}/events', methods=['GET'])
+async def stream_events():
+    """
+    Stream change events as Server-Sent Events (see routes/events.py).
+    Runs on the event loop, so open streams do not hold any threads.
+
+    Returns:
+        Response: text/event-stream response
+    """
+    async def generate():
+        subscriber = event_bus.subscribe_async()
+        try:
+            yield SSE_RETRY
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield SSE_HEARTBEAT
+                    continue
+                yield format_sse(event)
+        finally:
+            event_bus.unsubscribe(subscriber)
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    response.timeout = None  # Streams stay open indefinitely
+    return response
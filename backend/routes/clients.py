@@ -3,17 +3,32 @@ Client management routes.
 Handles CRUD operations for clients including image upload and processing.
 """
 
-from flask import Blueprint, request, jsonify, send_from_directory
+from flask import Blueprint, request, jsonify
 from bson import ObjectId
-import os
+from datetime import datetime, timezone
 from database import clients_collection
-from config import CLIENTS_FOLDER, API_BASE_URL
+from config import API_BASE_URL
 from utils import process_uploaded_image, allowed_file
+from storage import get_storage
+from events import list_cache, notify_change
 
 # Create blueprint for client routes
 clients_bp = Blueprint('clients', __name__)
 
 
+def _load_clients():
+    """
+    Load all clients that have not been deleted.
+    
+    Returns:
+        list: Client documents with string IDs
+    """
+    clients = list(clients_collection.find({'deletedAt': {'$exists': False}}))
+    for client in clients:
+        client['_id'] = str(client['_id'])
+    return clients
+
+
 @clients_bp.route(f'{API_BASE_URL}/clients', methods=['GET'])
 def get_clients():
     """
@@ -23,10 +38,7 @@ def get_clients():
         JSON: List of all clients with their details
     """
     try:
-        clients = list(clients_collection.find())
-        for client in clients:
-            client['_id'] = str(client['_id'])
-        return jsonify(clients), 200
+        return jsonify(list_cache.get_or_load('clients', _load_clients)), 200
     except Exception as e:
         return jsonify({'error': f'Error retrieving clients: {str(e)}'}), 500
 
@@ -65,7 +77,7 @@ def add_client():
             return jsonify({'error': 'Invalid file type. Allowed types: png, jpg, jpeg, gif, webp'}), 400
         
         # Process and crop the image
-        cropped_filename = process_uploaded_image(file, CLIENTS_FOLDER)
+        cropped_filename = process_uploaded_image(file, 'clients')
         
         # Create client document
         client = {
@@ -78,6 +90,7 @@ def add_client():
         # Save to database
         result = clients_collection.insert_one(client)
         client['_id'] = str(result.inserted_id)
+        notify_change('clients', 'insert', result.inserted_id)
         
         return jsonify(client), 201
         
@@ -91,7 +104,8 @@ def add_client():
 def delete_client(client_id):
     """
     Delete a client by ID.
-    Also removes the associated image file from the server.
+    The client is soft-deleted in a single round-trip; the document and its
+    image file are removed later by the background reaper.
     
     Args:
         client_id (str): MongoDB ObjectId of the client to delete
@@ -104,24 +118,17 @@ def delete_client(client_id):
         if not ObjectId.is_valid(client_id):
             return jsonify({'error': 'Invalid client ID format'}), 400
         
-        # Find the client
-        client = clients_collection.find_one({'_id': ObjectId(client_id)})
+        # Mark the client as deleted
+        client = clients_collection.find_one_and_update(
+            {'_id': ObjectId(client_id), 'deletedAt': {'$exists': False}},
+            {'$set': {'deletedAt': datetime.now(timezone.utc)}},
+            projection={'_id': 1}
+        )
         
         if not client:
             return jsonify({'error': 'Client not found'}), 404
         
-        # Delete associated image file
-        if 'image' in client:
-            image_path = os.path.join(CLIENTS_FOLDER, client['image'])
-            if os.path.exists(image_path):
-                try:
-                    os.remove(image_path)
-                except OSError as e:
-                    # Log error but continue with database deletion
-                    print(f'Warning: Could not delete image file: {e}')
-        
-        # Delete from database
-        clients_collection.delete_one({'_id': ObjectId(client_id)})
+        notify_change('clients', 'delete', client_id)
         
         return jsonify({'message': 'Client deleted successfully'}), 200
         
@@ -138,7 +145,7 @@ def client_image(filename):
         filename (str): Name of the image file
     
     Returns:
-        File: Image file from the clients upload folder
+        File: Image file from the clients storage backend
     """
-    return send_from_directory(CLIENTS_FOLDER, filename)
+    return get_storage().serve('clients', filename)
 
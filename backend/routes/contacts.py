@@ -6,15 +6,90 @@ Handles submission and retrieval of contact form data.
 from flask import Blueprint, request, jsonify
 from database import contact_collection
 from config import API_BASE_URL
+from idempotency import (
+    IDEMPOTENCY_HEADER, request_keys, check_duplicate, record_response, get_idempotency_store
+)
 
 # Create blueprint for contact routes
 contacts_bp = Blueprint('contacts', __name__)
 
 
+# ============================================================================
+# Submission helpers, shared with the async routes (routes/async_routes.py)
+# ============================================================================
+
+def parse_contact(data):
+    """
+    Extract and validate contact information from request data.
+    
+    Args:
+        data (dict): Parsed JSON request body, or None
+    
+    Returns:
+        tuple: (contact, None) if valid, otherwise (None, error message)
+    """
+    if not data:
+        return None, 'No data provided'
+    
+    # Extract and validate contact information
+    contact = {
+        'fullName': data.get('fullName', '').strip(),
+        'email': data.get('email', '').strip(),
+        'mobile': data.get('mobile', '').strip(),
+        'city': data.get('city', '').strip()
+    }
+    
+    # Validate required fields
+    if not all(contact.values()):
+        return None, 'All fields are required: fullName, email, mobile, and city'
+    
+    # Basic email validation
+    if '@' not in contact['email']:
+        return None, 'Invalid email format'
+    
+    return contact, None
+
+
+def contact_request_keys(contact, headers):
+    """
+    Build the idempotency keys of a contact submission.
+    
+    Args:
+        contact (dict): Validated contact from parse_contact()
+        headers: Request headers
+    
+    Returns:
+        tuple: (keys, fingerprint) as returned by request_keys()
+    """
+    return request_keys('contact', headers.get(IDEMPOTENCY_HEADER), {
+        **contact, 'email': contact['email'].lower()
+    })
+
+
+def contact_created_body(contact, inserted_id):
+    """
+    Build the response body for a saved contact.
+    
+    Args:
+        contact (dict): Validated contact from parse_contact()
+        inserted_id: ID of the inserted document
+    
+    Returns:
+        dict: Response body
+    """
+    return {
+        'message': 'Contact form submitted successfully',
+        'contact': {**contact, '_id': str(inserted_id)}
+    }
+
+
 @contacts_bp.route(f'{API_BASE_URL}/contact', methods=['POST'])
 def submit_contact():
     """
     Submit a contact form.
+    Retries carrying the same Idempotency-Key header, or repeating the same
+    data within the idempotency window, return the original response
+    without saving the contact again.
     
     Expected JSON data:
         - fullName: Full name of the contact (required)
@@ -26,35 +101,29 @@ def submit_contact():
         JSON: Created contact object with ID
     """
     try:
-        data = request.json
-        
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Extract and validate contact information
-        contact = {
-            'fullName': data.get('fullName', '').strip(),
-            'email': data.get('email', '').strip(),
-            'mobile': data.get('mobile', '').strip(),
-            'city': data.get('city', '').strip()
-        }
+        contact, error = parse_contact(request.json)
+        if error:
+            return jsonify({'error': error}), 400
         
-        # Validate required fields
-        if not all(contact.values()):
-            return jsonify({'error': 'All fields are required: fullName, email, mobile, and city'}), 400
+        # Suppress duplicate submissions
+        store = get_idempotency_store()
+        keys, fingerprint = contact_request_keys(contact, request.headers)
+        duplicate = check_duplicate(store, keys, fingerprint)
+        if duplicate:
+            body, status, headers = duplicate
+            return jsonify(body), status, headers
         
-        # Basic email validation
-        if '@' not in contact['email']:
-            return jsonify({'error': 'Invalid email format'}), 400
+        try:
+            # Save to database
+            result = contact_collection.insert_one(contact)
+        except Exception:
+            store.release(keys)
+            raise
         
-        # Save to database
-        result = contact_collection.insert_one(contact)
-        contact['_id'] = str(result.inserted_id)
+        body = contact_created_body(contact, result.inserted_id)
+        record_response(store, keys, body, 201)
         
-        return jsonify({
-            'message': 'Contact form submitted successfully',
-            'contact': contact
-        }), 201
+        return jsonify(body), 201
         
     except Exception as e:
         return jsonify({'error': f'Error submitting contact form: {str(e)}'}), 500
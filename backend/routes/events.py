@@ -0,0 +1,55 @@
+"""
+Change notification routes.
+Streams project and client changes to browsers using Server-Sent Events.
+"""
+
+import queue
+import threading
+from flask import Blueprint, Response, jsonify
+from events import event_bus, format_sse, SSE_RETRY, SSE_HEARTBEAT
+from config import API_BASE_URL, SSE_HEARTBEAT_SECONDS, SSE_MAX_SYNC_STREAMS
+
+# Create blueprint for event routes
+events_bp = Blueprint('events', __name__)
+
+# Each open stream holds a server thread, so only a few may be open at once
+_stream_slots = threading.BoundedSemaphore(SSE_MAX_SYNC_STREAMS)
+
+
+@events_bp.route(f'{API_BASE_URL}/events', methods=['GET'])
+def stream_events():
+    """
+    Stream change events as Server-Sent Events.
+    Each event has type 'change' and a JSON payload with the changed
+    collection, the operation and the document ID. A comment line is sent
+    periodically to keep idle connections open through proxies.
+    At most SSE_MAX_SYNC_STREAMS streams are open per process; further
+    clients get a 503 and fall back to loading lists on page load.
+
+    Returns:
+        Response: text/event-stream response
+    """
+    if not _stream_slots.acquire(blocking=False):
+        return jsonify({'error': 'Too many open event streams'}), 503, {'Retry-After': '60'}
+
+    def generate():
+        subscriber = event_bus.subscribe()
+        try:
+            yield SSE_RETRY
+            while True:
+                try:
+                    event = subscriber.get(timeout=SSE_HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield SSE_HEARTBEAT
+                    continue
+                yield format_sse(event)
+        finally:
+            event_bus.unsubscribe(subscriber)
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    # Released when the server closes the response, even if streaming never started
+    response.call_on_close(_stream_slots.release)
+    return response
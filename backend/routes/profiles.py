@@ -0,0 +1,50 @@
+"""
+Profiling admin routes.
+Lists captured request profiles and serves their collapsed-stack files.
+Both endpoints require the profiling secret in the X-Profile-Token header.
+"""
+
+from flask import Blueprint, request, jsonify, send_file
+from profiling import is_authorized, list_captures, capture_path
+from config import API_BASE_URL
+
+# Create blueprint for profiling routes
+profiles_bp = Blueprint('profiles', __name__)
+
+
+@profiles_bp.route(f'{API_BASE_URL}/admin/profiles', methods=['GET'])
+def get_profiles():
+    """
+    Retrieve the slowest captured requests.
+
+    Query parameters:
+        - limit: Maximum number of captures to return (default 20)
+
+    Returns:
+        JSON: List of capture summaries, slowest first
+    """
+    if not is_authorized(request.headers):
+        return jsonify({'error': 'Profiling token required'}), 403
+
+    limit = request.args.get('limit', 20, type=int)
+    return jsonify(list_captures(limit)), 200
+
+
+@profiles_bp.route(f'{API_BASE_URL}/admin/profiles/<capture_id>', methods=['GET'])
+def get_profile_stacks(capture_id):
+    """
+    Download the collapsed stacks of a capture.
+
+    Args:
+        capture_id (str): Capture ID from the profiles list
+
+    Returns:
+        File: Collapsed-stack text file
+    """
+    if not is_authorized(request.headers):
+        return jsonify({'error': 'Profiling token required'}), 403
+
+    path = capture_path(capture_id)
+    if not path:
+        return jsonify({'error': 'Profile not found'}), 404
+    return send_file(path, mimetype='text/plain')
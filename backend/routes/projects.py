@@ -3,17 +3,32 @@ Project management routes.
 Handles CRUD operations for projects including image upload and processing.
 """
 
-from flask import Blueprint, request, jsonify, send_from_directory
+from flask import Blueprint, request, jsonify
 from bson import ObjectId
-import os
+from datetime import datetime, timezone
 from database import projects_collection
-from config import PROJECTS_FOLDER, API_BASE_URL
+from config import API_BASE_URL
 from utils import process_uploaded_image, allowed_file
+from storage import get_storage
+from events import list_cache, notify_change
 
 # Create blueprint for project routes
 projects_bp = Blueprint('projects', __name__)
 
 
+def _load_projects():
+    """
+    Load all projects that have not been deleted.
+    
+    Returns:
+        list: Project documents with string IDs
+    """
+    projects = list(projects_collection.find({'deletedAt': {'$exists': False}}))
+    for project in projects:
+        project['_id'] = str(project['_id'])
+    return projects
+
+
 @projects_bp.route(f'{API_BASE_URL}/projects', methods=['GET'])
 def get_projects():
     """
@@ -23,10 +38,7 @@ def get_projects():
         JSON: List of all projects with their details
     """
     try:
-        projects = list(projects_collection.find())
-        for project in projects:
-            project['_id'] = str(project['_id'])
-        return jsonify(projects), 200
+        return jsonify(list_cache.get_or_load('projects', _load_projects)), 200
     except Exception as e:
         return jsonify({'error': f'Error retrieving projects: {str(e)}'}), 500
 
@@ -63,7 +75,7 @@ def add_project():
             return jsonify({'error': 'Invalid file type. Allowed types: png, jpg, jpeg, gif, webp'}), 400
         
         # Process and crop the image
-        cropped_filename = process_uploaded_image(file, PROJECTS_FOLDER)
+        cropped_filename = process_uploaded_image(file, 'projects')
         
         # Create project document
         project = {
@@ -75,6 +87,7 @@ def add_project():
         # Save to database
         result = projects_collection.insert_one(project)
         project['_id'] = str(result.inserted_id)
+        notify_change('projects', 'insert', result.inserted_id)
         
         return jsonify(project), 201
         
@@ -88,7 +101,8 @@ def add_project():
 def delete_project(project_id):
     """
     Delete a project by ID.
-    Also removes the associated image file from the server.
+    The project is soft-deleted in a single round-trip; the document and its
+    image file are removed later by the background reaper.
     
     Args:
         project_id (str): MongoDB ObjectId of the project to delete
@@ -101,24 +115,17 @@ def delete_project(project_id):
         if not ObjectId.is_valid(project_id):
             return jsonify({'error': 'Invalid project ID format'}), 400
         
-        # Find the project
-        project = projects_collection.find_one({'_id': ObjectId(project_id)})
+        # Mark the project as deleted
+        project = projects_collection.find_one_and_update(
+            {'_id': ObjectId(project_id), 'deletedAt': {'$exists': False}},
+            {'$set': {'deletedAt': datetime.now(timezone.utc)}},
+            projection={'_id': 1}
+        )
         
         if not project:
             return jsonify({'error': 'Project not found'}), 404
         
-        # Delete associated image file
-        if 'image' in project:
-            image_path = os.path.join(PROJECTS_FOLDER, project['image'])
-            if os.path.exists(image_path):
-                try:
-                    os.remove(image_path)
-                except OSError as e:
-                    # Log error but continue with database deletion
-                    print(f'Warning: Could not delete image file: {e}')
-        
-        # Delete from database
-        projects_collection.delete_one({'_id': ObjectId(project_id)})
+        notify_change('projects', 'delete', project_id)
         
         return jsonify({'message': 'Project deleted successfully'}), 200
         
@@ -135,7 +142,7 @@ def project_image(filename):
         filename (str): Name of the image file
     
     Returns:
-        File: Image file from the projects upload folder
+        File: Image file from the projects storage backend
     """
-    return send_from_directory(PROJECTS_FOLDER, filename)
+    return get_storage().serve('projects', filename)
 
@@ -0,0 +1,273 @@
+"""
+Storage backends for uploaded images.
+Provides a common interface over local disk and S3-compatible object storage
+so that uploads are visible to every application instance.
+"""
+
+import os
+import shutil
+import tempfile
+from flask import send_from_directory, abort
+from werkzeug.utils import secure_filename
+from config import (
+    STORAGE_BACKEND, UPLOAD_FOLDER,
+    S3_BUCKET, S3_ENDPOINT_URL, S3_REGION, S3_ACCESS_KEY, S3_SECRET_KEY,
+    S3_MAX_POOL_CONNECTIONS, S3_MULTIPART_THRESHOLD, S3_MULTIPART_CHUNKSIZE,
+    STORAGE_CACHE_FOLDER, STORAGE_CACHE_MAX_BYTES
+)
+
+
+class LocalStorage:
+    """
+    Store images on the local filesystem under the upload folder.
+    Files are grouped into one sub-folder per category (projects, clients).
+    """
+
+    def __init__(self, root=UPLOAD_FOLDER):
+        self.root = root
+
+    def _folder(self, category):
+        folder = os.path.join(self.root, category)
+        os.makedirs(folder, exist_ok=True)
+        return folder
+
+    def save(self, category, filename, source_path):
+        """
+        Move a processed image into storage.
+
+        Args:
+            category (str): Storage category, e.g. 'projects' or 'clients'
+            filename (str): Name the image is stored under
+            source_path (str): Path of the local file to store
+        """
+        shutil.move(source_path, os.path.join(self._folder(category), filename))
+
+    def delete(self, category, filename):
+        """
+        Delete an image from storage. Missing files are ignored.
+
+        Args:
+            category (str): Storage category
+            filename (str): Name of the stored image
+        """
+        path = os.path.join(self._folder(category), filename)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def list_files(self, category):
+        """
+        List the stored images of a category.
+
+        Args:
+            category (str): Storage category
+
+        Returns:
+            list: (filename, last modified timestamp) tuples
+        """
+        with os.scandir(self._folder(category)) as entries:
+            return [(entry.name, entry.stat().st_mtime) for entry in entries if entry.is_file()]
+
+    def serve(self, category, filename):
+        """
+        Build a Flask response serving a stored image.
+
+        Args:
+            category (str): Storage category
+            filename (str): Name of the stored image
+
+        Returns:
+            Response: Flask file response
+        """
+        return send_from_directory(self._folder(category), filename)
+
+
+class S3Storage:
+    """
+    Store images in an S3-compatible bucket (AWS S3, MinIO, ...).
+
+    Connections are pooled by a single shared boto3 client, large files are
+    sent as multipart uploads, and served images are kept in a size-bounded
+    local read-through cache so hot images do not hit the bucket every time.
+    Stored names are unique per upload (see process_uploaded_image), so a
+    cached copy never goes stale and needs no revalidation.
+    """
+
+    def __init__(self, bucket=S3_BUCKET, endpoint_url=S3_ENDPOINT_URL,
+                 cache_folder=STORAGE_CACHE_FOLDER, cache_max_bytes=STORAGE_CACHE_MAX_BYTES):
+        try:
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+            from botocore.config import Config
+        except ImportError:
+            raise RuntimeError('The s3 storage backend requires boto3: pip install boto3')
+
+        if not bucket:
+            raise RuntimeError('S3_BUCKET must be set to use the s3 storage backend')
+
+        self.bucket = bucket
+        self.client = boto3.client(
+            's3',
+            endpoint_url=endpoint_url or None,
+            region_name=S3_REGION,
+            aws_access_key_id=S3_ACCESS_KEY,
+            aws_secret_access_key=S3_SECRET_KEY,
+            config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE
+        )
+        self.cache_folder = cache_folder
+        self.staging_folder = f'{cache_folder}-staging'
+        self.cache_max_bytes = cache_max_bytes
+
+    @staticmethod
+    def _key(category, filename):
+        return f'{category}/{filename}'
+
+    def _cache_path(self, category, filename):
+        folder = os.path.join(self.cache_folder, category)
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, filename)
+
+    def save(self, category, filename, source_path):
+        """
+        Upload a processed image to the bucket and remove the local file.
+
+        Args:
+            category (str): Storage category, e.g. 'projects' or 'clients'
+            filename (str): Name the image is stored under
+            source_path (str): Path of the local file to upload
+        """
+        try:
+            self.client.upload_file(
+                source_path, self.bucket, self._key(category, filename),
+                Config=self.transfer_config
+            )
+        finally:
+            if os.path.exists(source_path):
+                os.remove(source_path)
+
+    def delete(self, category, filename):
+        """
+        Delete an image from the bucket and the local cache.
+
+        Args:
+            category (str): Storage category
+            filename (str): Name of the stored image
+        """
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(category, filename))
+        cache_path = self._cache_path(category, filename)
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+    def list_files(self, category):
+        """
+        List the stored images of a category.
+
+        Args:
+            category (str): Storage category
+
+        Returns:
+            list: (filename, last modified timestamp) tuples
+        """
+        prefix = self._key(category, '')
+        files = []
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                files.append((obj['Key'][len(prefix):], obj['LastModified'].timestamp()))
+        return files
+
+    def serve(self, category, filename):
+        """
+        Build a Flask response serving a stored image.
+        The image is downloaded into the local cache on first access.
+
+        Args:
+            category (str): Storage category
+            filename (str): Name of the stored image
+
+        Returns:
+            Response: Flask file response
+        """
+        filename = secure_filename(filename)
+        cache_path = self._cache_path(category, filename)
+
+        try:
+            # Refresh the access time so eviction keeps hot images
+            os.utime(cache_path)
+        except FileNotFoundError:
+            # Not cached yet, or evicted by a concurrent request
+            self._download(category, filename, cache_path)
+            self._evict_cache()
+
+        return send_from_directory(os.path.dirname(cache_path), filename)
+
+    def _download(self, category, filename, cache_path):
+        """
+        Download an image into the cache, aborting with 404 if it does not exist.
+        """
+        from botocore.exceptions import ClientError
+
+        # Download into a private staging folder outside the cache, so eviction
+        # never sees partial files and concurrent readers never serve one
+        os.makedirs(self.staging_folder, exist_ok=True)
+        download_folder = tempfile.mkdtemp(dir=self.staging_folder)
+        try:
+            tmp_path = os.path.join(download_folder, filename)
+            try:
+                self.client.download_file(
+                    self.bucket, self._key(category, filename), tmp_path,
+                    Config=self.transfer_config
+                )
+            except ClientError:
+                abort(404)
+            os.replace(tmp_path, cache_path)
+        finally:
+            shutil.rmtree(download_folder, ignore_errors=True)
+
+    def _evict_cache(self):
+        """
+        Remove least recently used cached images until the cache fits its size limit.
+        """
+        entries = []
+        for dirpath, _, filenames in os.walk(self.cache_folder):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+_storage = None
+
+
+def get_storage():
+    """
+    Get the configured storage backend, creating it on first use.
+
+    Returns:
+        LocalStorage | S3Storage: Storage backend selected by STORAGE_BACKEND
+    """
+    global _storage
+    if _storage is None:
+        if STORAGE_BACKEND == 's3':
+            _storage = S3Storage()
+        elif STORAGE_BACKEND == 'local':
+            _storage = LocalStorage()
+        else:
+            raise RuntimeError(f'Unknown storage backend: {STORAGE_BACKEND}')
+    return _storage
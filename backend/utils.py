@@ -4,9 +4,12 @@ Contains helper functions for image cropping and file validation.
 """
 
 import os
+import tempfile
+import uuid
 from werkzeug.utils import secure_filename
 from PIL import Image
 from config import ALLOWED_EXTENSIONS, TARGET_IMAGE_SIZE
+from storage import get_storage
 
 
 def allowed_file(filename):
@@ -83,14 +86,16 @@ def secure_file_path(filename, upload_folder):
     return secure_name, filepath
 
 
-def process_uploaded_image(file, upload_folder, prefix='cropped'):
+def process_uploaded_image(file, category, prefix='cropped'):
     """
-    Process an uploaded image: save, crop, and return the cropped filename.
-    The original file is removed after cropping.
+    Process an uploaded image: crop it and hand it to the storage backend.
+    The image is cropped in a temporary folder, so the original upload never
+    reaches storage. Stored names carry a random suffix, so uploads sharing a
+    filename never overwrite each other.
     
     Args:
         file: File object from Flask request
-        upload_folder (str): Folder to save the image
+        category (str): Storage category for the image, e.g. 'projects' or 'clients'
         prefix (str): Prefix for the cropped filename. Defaults to 'cropped'
         
     Returns:
@@ -102,26 +107,19 @@ def process_uploaded_image(file, upload_folder, prefix='cropped'):
     if not file or not allowed_file(file.filename):
         raise ValueError('Invalid file type')
     
-    # Generate secure file paths
-    original_filename, original_path = secure_file_path(file.filename, upload_folder)
-    cropped_filename = f"{prefix}_{original_filename}"
-    cropped_path = os.path.join(upload_folder, cropped_filename)
-    
-    # Save original file
-    file.save(original_path)
-    
-    try:
-        # Crop the image
-        crop_image(original_path, cropped_path)
+    with tempfile.TemporaryDirectory() as work_folder:
+        # Generate secure file paths
+        original_filename, original_path = secure_file_path(file.filename, work_folder)
+        cropped_filename = f"{prefix}_{uuid.uuid4().hex[:12]}_{original_filename}"
+        cropped_path = os.path.join(work_folder, cropped_filename)
         
-        # Remove original file
-        if os.path.exists(original_path):
-            os.remove(original_path)
+        # Save original file
+        file.save(original_path)
         
-        return cropped_filename
-    except Exception as e:
-        # Clean up on error
-        if os.path.exists(original_path):
-            os.remove(original_path)
-        raise ValueError(f'Error processing image: {str(e)}')
-
+        try:
+            # Crop the image and store the result
+            crop_image(original_path, cropped_path)
+            get_storage().save(category, cropped_filename, cropped_path)
+            return cropped_filename
+        except Exception as e:
+            raise ValueError(f'Error processing image: {str(e)}')
@@ -5,8 +5,33 @@ document.addEventListener('DOMContentLoaded', () => {
     loadProjects();
     loadClients();
     setupForms();
+    subscribeToChanges();
 });
 
+// Reload projects and clients when the backend reports a change
+function subscribeToChanges() {
+    if (!window.EventSource) {
+        return;
+    }
+    
+    const events = new EventSource(`${API_BASE_URL}/events`);
+    events.onerror = () => {
+        // The server refuses streams when busy (503), which closes the connection
+        // for good; lists loaded on page load stay valid, so try again later
+        if (events.readyState === EventSource.CLOSED) {
+            setTimeout(subscribeToChanges, 60000 + Math.random() * 30000);
+        }
+    };
+    events.addEventListener('change', (e) => {
+        const change = JSON.parse(e.data);
+        if (change.collection === 'projects') {
+            loadProjects();
+        } else if (change.collection === 'clients') {
+            loadClients();
+        }
+    });
+}
+
 // Load projects from backend
 async function loadProjects() {
     try {
@@ -71,6 +96,54 @@ async function loadClients() {
     }
 }
 
+// Generate a random key identifying one filled-in form
+function generateIdempotencyKey() {
+    if (window.crypto && crypto.randomUUID) {
+        return crypto.randomUUID();
+    }
+    return `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+}
+
+// Post a contact form. Double-clicks and retries of the same filled-in form
+// reuse one Idempotency-Key, so the backend saves the contact only once.
+// Returns null if the form is already being submitted.
+async function postContact(form, data) {
+    if (form.dataset.submitting) {
+        return null;
+    }
+    if (!form.dataset.idempotencyKey) {
+        form.dataset.idempotencyKey = generateIdempotencyKey();
+        // Editing the form makes it a new submission
+        form.addEventListener('input', () => delete form.dataset.idempotencyKey, { once: true });
+    }
+    
+    const submitButton = form.querySelector('button[type="submit"], button:not([type])');
+    form.dataset.submitting = 'true';
+    if (submitButton) {
+        submitButton.disabled = true;
+    }
+    
+    try {
+        const response = await fetch(`${API_BASE_URL}/contact`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Idempotency-Key': form.dataset.idempotencyKey
+            },
+            body: JSON.stringify(data)
+        });
+        if (response.ok) {
+            delete form.dataset.idempotencyKey;
+        }
+        return response;
+    } finally {
+        delete form.dataset.submitting;
+        if (submitButton) {
+            submitButton.disabled = false;
+        }
+    }
+}
+
 // Setup form handlers
 function setupForms() {
     // Consultation form (hero section)
@@ -88,13 +161,10 @@ function setupForms() {
             };
             
             try {
-                const response = await fetch(`${API_BASE_URL}/contact`, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify(data)
-                });
+                const response = await postContact(consultationForm, data);
+                if (!response) {
+                    return;  // Already being submitted
+                }
                 
                 if (response.ok) {
                     showMessage('Thank you! We will contact you soon.', 'success');
@@ -122,13 +192,10 @@ function setupForms() {
             };
             
             try {
-                const response = await fetch(`${API_BASE_URL}/contact`, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify(data)
-                });
+                const response = await postContact(contactForm, data);
+                if (!response) {
+                    return;  // Already being submitted
+                }
                 
                 if (response.ok) {
                     showMessage('Thank you for contacting us! We will get back to you soon.', 'success');